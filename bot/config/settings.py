@@ -3,14 +3,22 @@
 Bot configuration settings
 """
 
+import logging
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 class Settings:
     """Bot configuration settings"""
     
+    __slots__ = (
+        'TELEGRAM_API_ID', 'TELEGRAM_API_HASH', 'TELEGRAM_PHONE', 'TELEGRAM_CHANNEL',
+        'DISCORD_WEBHOOKS', 'SEEN_MESSAGES_FILE', 'SOURCE_TYPE', 'INITIAL_CHECK_LIMIT'
+    )
+    
     def __init__(self):
         # Telegram settings
         self.TELEGRAM_API_ID = int(os.getenv('TELEGRAM_API_ID', 0))
@@ -20,16 +28,17 @@ class Settings:
         
         # Discord settings
         self.DISCORD_WEBHOOKS = [
-            url.strip() 
-            for url in os.getenv('DISCORD_WEBHOOK_URL', '').split(',') 
-            if url.strip()
+            url
+            for url in (part.strip() for part in os.getenv('DISCORD_WEBHOOK_URL', '').split(','))
+            if url
         ]
         
-        # Debug output
-        print(f"DEBUG - API_ID: {self.TELEGRAM_API_ID}")
-        print(f"DEBUG - API_HASH: {self.TELEGRAM_API_HASH[:8]}...")
-        print(f"DEBUG - PHONE: {self.TELEGRAM_PHONE}")
-        print(f"DEBUG - WEBHOOK COUNT: {len(self.DISCORD_WEBHOOKS)}")
+        # Debug output (lazy formatting, no secrets)
+        logger.debug(
+            "API_ID: %s, API_HASH set: %s, PHONE set: %s, WEBHOOK COUNT: %d",
+            self.TELEGRAM_API_ID, bool(self.TELEGRAM_API_HASH),
+            bool(self.TELEGRAM_PHONE), len(self.DISCORD_WEBHOOKS)
+        )
     
         # Storage settings
         self.SEEN_MESSAGES_FILE = os.getenv('SEEN_MESSAGES_FILE', '/tmp/seen_messages.json')
@@ -8,7 +8,7 @@ import logging
 from typing import Dict, Any
 
 from .sources.telegram_source import TelegramSource
-from .shared.club_configs import CLUB_CONFIGS, detect_clubs
+from .shared.club_configs import CLUB_CONFIGS
 from .shared.content_analyzer import ContentAnalyzer
 from .shared.discord_sender import DiscordSender
 from .shared.storage import MessageStorage
@@ -62,11 +62,11 @@ class TransferBot:
         if self.storage.is_seen(message_id):
             return False
             
-        # Detect clubs
-        clubs_detected = detect_clubs(text)
+        # Analyze the message in a single pass
+        analysis = self.analyzer.analyze(text)
         
         # Apply filtering logic
-        should_post = self.analyzer.should_post(text, clubs_detected)
+        should_post = self.analyzer.should_post(analysis)
         
         # Mark as seen regardless
         self.storage.mark_seen(message_id)
@@ -74,21 +74,25 @@ class TransferBot:
         if not should_post:
             return False
             
-        # Post to Discord
-        for club_key in clubs_detected:
-            if club_key in CLUB_CONFIGS:
-                # Add analysis to message data
-                message_data['source_tier'] = f"Tier {self.analyzer.get_source_tier(text)}"
-                message_data['confidence'] = self.analyzer.get_confidence_level(text)
-                
-                success = self.discord_sender.send_message(
-                    message_data, 
-                    club_key, 
-                    CLUB_CONFIGS[club_key]
-                )
-                
-                if success:
-                    logger.info(f"✅ Posted: {club_key} - {text[:50]}...")
+        # Add analysis to message data
+        message_data['source_tier'] = f"Tier {analysis.source_tier}"
+        message_data['confidence'] = analysis.confidence
+        
+        # Post to Discord for every detected club concurrently
+        club_keys = [club_key for club_key in analysis.clubs if club_key in CLUB_CONFIGS]
+        results = await asyncio.gather(
+            *(
+                self.discord_sender.send_message(message_data, club_key, CLUB_CONFIGS[club_key])
+                for club_key in club_keys
+            ),
+            return_exceptions=True
+        )
+        
+        for club_key, result in zip(club_keys, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Error posting {club_key}: {result}")
+            elif result:
+                logger.info(f"✅ Posted: {club_key} - {text[:50]}...")
                     
         return True
     
@@ -96,15 +100,14 @@ class TransferBot:
         """Find and post the first sendable message from recent history"""
         logger.info("🔍 Finding first sendable message...")
         
-        for check_limit in range(1, max_limit + 1):
-            messages = await self.source.fetch_recent_messages(check_limit)
-            
-            # Check messages from oldest to newest (reversed order)
-            for message_data in reversed(messages):
-                if not self.storage.is_seen(message_data['id']):
-                    if await self.process_message(message_data):
-                        logger.info(f"✅ Posted startup message after checking {check_limit} recent messages")
-                        return True
+        messages = await self.source.fetch_recent_messages(max_limit)
+        
+        # Check messages from newest to oldest so the most recent sendable one is posted
+        for checked, message_data in enumerate(messages, start=1):
+            if not self.storage.is_seen(message_data['id']):
+                if await self.process_message(message_data):
+                    logger.info(f"✅ Posted startup message after checking {checked} recent messages")
+                    return True
                         
         logger.info(f"ℹ️ No sendable messages found in last {max_limit} messages")
         return False
@@ -138,6 +141,8 @@ class TransferBot:
             raise
         finally:
             self.storage.save()
+            self.storage.close()
+            self.discord_sender.close()
             if self.source:
                 await self.source.disconnect()
             logger.info("💾 Bot shutdown complete")
\ No newline at end of file
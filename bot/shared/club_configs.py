@@ -3,6 +3,9 @@
 Club configurations and matching logic
 """
 
+import ahocorasick
+from typing import Optional
+
 # Club configurations (extracted from reddit_bot.py)
 CLUB_CONFIGS = {
     'chelsea': {
@@ -56,15 +59,36 @@ CLUB_CONFIGS = {
     }
 }
 
-def detect_clubs(text: str) -> list:
-    """Detect which clubs are mentioned in text"""
-    text_lower = text.lower()
-    clubs_found = []
+# Flat (keyword, club_key) table so matching never walks the nested configs
+CLUB_KEYWORDS = tuple(
+    (keyword.lower(), club_key)
+    for club_key, config in CLUB_CONFIGS.items()
+    for keyword in config['keywords']
+)
+
+def _build_club_automaton() -> ahocorasick.Automaton:
+    """Build a keyword automaton mapping every club keyword to its club key"""
+    automaton = ahocorasick.Automaton()
+    for keyword, club_key in CLUB_KEYWORDS:
+        automaton.add_word(keyword, club_key)
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import so each message is scanned in a single pass
+CLUB_AUTOMATON = _build_club_automaton()
+
+def detect_clubs(text: str, text_lower: Optional[str] = None) -> list:
+    """Detect which clubs are mentioned in text (pass text_lower if already computed)"""
+    if text_lower is None:
+        text_lower = text.lower()
+        
+    matched = set()
+    for _, club_key in CLUB_AUTOMATON.iter(text_lower):
+        matched.add(club_key)
+        
+        # Every club already found, nothing left to scan for
+        if len(matched) == len(CLUB_CONFIGS):
+            break
     
-    for club_key, config in CLUB_CONFIGS.items():
-        for keyword in config['keywords']:
-            if keyword in text_lower:
-                clubs_found.append(club_key)
-                break
-                
-    return clubs_found
\ No newline at end of file
+    # Keep configuration order so clubs are posted in a stable order
+    return [club_key for club_key in CLUB_CONFIGS if club_key in matched]
\ No newline at end of file
@@ -3,94 +3,155 @@
 Content analysis for transfer news
 """
 
-import re
-from typing import Dict, List
+import ahocorasick
+from dataclasses import dataclass
+from typing import Dict, List, Set
+
+from .club_configs import detect_clubs
 
 # Tier 1 sources (from our analysis)
-TIER_1_SOURCES = [
+TIER_1_SOURCES = frozenset([
     'fabrizio romano', 'david ornstein', 'sky sports', 'the athletic', 
     'guardian', 'bbc sport', 'florian plettenberg'
-]
+])
 
-TIER_2_SOURCES = [
+TIER_2_SOURCES = frozenset([
     'di marzio', 'bild', 'kicker', 'sport bild', 'marca', 'as'
-]
+])
 
 # High confidence formats
-HIGH_CONFIDENCE_FORMATS = [
+HIGH_CONFIDENCE_FORMATS = frozenset([
     '📝 deal done', '🚨 official', 'here we go', '🚨 breaking', '🚨 confirmed'
-]
+])
 
 # Transfer keywords
-TRANSFER_KEYWORDS = [
+TRANSFER_KEYWORDS = frozenset([
     'transfer', 'signing', 'signs', 'joins', 'agreement', 'deal', 'contract',
     'move', 'bid', 'offer', 'target', 'medical', 'done deal', 'official', 
     'confirmed', 'breaking', 'exclusive', 'loan', 'release clause'
-]
+])
 
 # Spam indicators
-SPAM_INDICATORS = [
+SPAM_INDICATORS = frozenset([
     't.me/+', 'betting', 'casino', 'place your bets', 'promo code',
     'free spins', 'bonus', 'click here', 'register now'
-]
+])
+
+def _build_analysis_automaton() -> ahocorasick.Automaton:
+    """Build one automaton tagging every indicator with the categories it belongs to"""
+    categories = {
+        'spam': SPAM_INDICATORS,
+        'tier_1': TIER_1_SOURCES,
+        'tier_2': TIER_2_SOURCES,
+        'high_confidence': HIGH_CONFIDENCE_FORMATS,
+        'transfer': TRANSFER_KEYWORDS,
+    }
+    
+    tags: Dict[str, Set[str]] = {}
+    for category, indicators in categories.items():
+        for indicator in indicators:
+            tags.setdefault(indicator, set()).add(category)
+    
+    automaton = ahocorasick.Automaton()
+    for indicator, indicator_tags in tags.items():
+        automaton.add_word(indicator, frozenset(indicator_tags))
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import so every check is a single pass over the text
+ANALYSIS_AUTOMATON = _build_analysis_automaton()
+
+@dataclass(slots=True)
+class Analysis:
+    """Result of a single pass over a message"""
+    is_spam: bool
+    source_tier: int
+    confidence: str
+    is_transfer_related: bool
+    clubs: List[str]
 
 class ContentAnalyzer:
     """Analyzes transfer news content for quality and relevance"""
     
-    def is_spam(self, text: str) -> bool:
-        """Check if message is spam"""
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in SPAM_INDICATORS)
+    __slots__ = ()
     
-    def get_source_tier(self, text: str) -> int:
-        """Get source tier (1=best, 3=worst)"""
-        text_lower = text.lower()
-        
-        for source in TIER_1_SOURCES:
-            if source in text_lower:
-                return 1
+    def _scan(self, text_lower: str) -> Set[str]:
+        """Collect every category matched anywhere in lowercased text"""
+        matched = set()
+        for _, tags in ANALYSIS_AUTOMATON.iter(text_lower):
+            matched |= tags
+        return matched
+    
+    def _tier_from(self, matched: Set[str]) -> int:
+        """Source tier for a set of matched categories"""
+        if 'tier_1' in matched:
+            return 1
                 
-        for source in TIER_2_SOURCES:
-            if source in text_lower:
-                return 2
+        if 'tier_2' in matched:
+            return 2
                 
         return 3
     
-    def get_confidence_level(self, text: str) -> str:
-        """Get confidence level based on format"""
-        text_lower = text.lower()
-        
-        for format_indicator in HIGH_CONFIDENCE_FORMATS:
-            if format_indicator in text_lower:
-                return 'high'
+    def _confidence_from(self, matched: Set[str]) -> str:
+        """Confidence level for a set of matched categories"""
+        if 'high_confidence' in matched:
+            return 'high'
                 
-        if any(keyword in text_lower for keyword in TRANSFER_KEYWORDS):
+        if 'transfer' in matched:
             return 'medium'
             
         return 'low'
     
+    def analyze(self, text: str) -> Analysis:
+        """Run every check over the text in one pass"""
+        text_lower = text.lower()
+        matched = self._scan(text_lower)
+        
+        return Analysis(
+            is_spam='spam' in matched,
+            source_tier=self._tier_from(matched),
+            confidence=self._confidence_from(matched),
+            is_transfer_related='transfer' in matched,
+            clubs=detect_clubs(text, text_lower)
+        )
+    
+    def _matches(self, text_lower: str, category: str) -> bool:
+        """Check for a single category, stopping at the first hit"""
+        return any(category in tags for _, tags in ANALYSIS_AUTOMATON.iter(text_lower))
+    
+    def is_spam(self, text: str) -> bool:
+        """Check if message is spam"""
+        return self._matches(text.lower(), 'spam')
+    
+    def get_source_tier(self, text: str) -> int:
+        """Get source tier (1=best, 3=worst)"""
+        return self._tier_from(self._scan(text.lower()))
+    
+    def get_confidence_level(self, text: str) -> str:
+        """Get confidence level based on format"""
+        return self._confidence_from(self._scan(text.lower()))
+    
     def is_transfer_related(self, text: str) -> bool:
         """Check if content is transfer related"""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in TRANSFER_KEYWORDS)
+        return self._matches(text.lower(), 'transfer')
     
-    def should_post(self, text: str, clubs_detected: List[str]) -> bool:
+    def should_post(self, analysis: Analysis) -> bool:
         """Main filtering logic"""
         # Skip spam
-        if self.is_spam(text):
+        if analysis.is_spam:
             return False
             
         # Must mention our target clubs
-        if not clubs_detected:
+        if not analysis.clubs:
             return False
             
         # Must be transfer related
-        if not self.is_transfer_related(text):
+        if not analysis.is_transfer_related:
             return False
             
         # Check source quality
-        source_tier = self.get_source_tier(text)
-        confidence = self.get_confidence_level(text)
+        source_tier = analysis.source_tier
+        confidence = analysis.confidence
         
         # High confidence posts - allow Tier 1 & 2
         if confidence == 'high':
@@ -3,20 +3,69 @@
 Discord webhook sender (extracted from reddit_bot.py)
 """
 
+import asyncio
+import json
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List
 
+from .club_configs import CLUB_CONFIGS
+
 logger = logging.getLogger(__name__)
 
 class DiscordSender:
     """Handles Discord webhook posting"""
     
+    __slots__ = ('webhook_urls', 'session')
+    
     def __init__(self, webhook_urls: List[str]):
         self.webhook_urls = webhook_urls
+        
+        # Back off on rate limits and transient errors, honouring Retry-After
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        
+        # Keep-alive session so each post reuses an open connection. A message can name
+        # every club, and each club's send fans out to every webhook at once, so keep
+        # enough connections for all of them or urllib3 discards the extras
+        pool_size = max(len(webhook_urls), 1)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * len(CLUB_CONFIGS),
+            max_retries=retry
+        ))
+    
+    def _post(self, webhook_url: str, body: bytes) -> bool:
+        """Post a serialized payload to a single webhook"""
+        try:
+            response = self.session.post(
+                webhook_url,
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            )
+            
+            if response.status_code == 204:
+                return True
+                
+            logger.error(f"Discord webhook failed: {response.status_code}")
+                
+        except requests.RequestException as e:
+            logger.error(f"Error posting to Discord webhook: {e}")
+            
+        return False
     
-    def send_message(self, message_data: Dict, club_key: str, club_config: Dict) -> bool:
+    async def send_message(self, message_data: Dict, club_key: str, club_config: Dict) -> bool:
         """Send message to Discord webhooks"""
         
         # Create clean embed
@@ -32,28 +81,23 @@ class DiscordSender:
         
         payload = {"embeds": [embed]}
         
-        # Send to all webhooks
-        success_count = 0
-        for webhook_url in self.webhook_urls:
-            try:
-                response = requests.post(
-                    webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=10
-                )
-                
-                if response.status_code == 204:
-                    success_count += 1
-                else:
-                    logger.error(f"Discord webhook failed: {response.status_code}")
-                    
-            except requests.RequestException as e:
-                logger.error(f"Error posting to Discord webhook: {e}")
+        # Serialize once and share the body across every webhook
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        
+        # Send to all webhooks concurrently without blocking the event loop
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._post, webhook_url, body)
+            for webhook_url in self.webhook_urls
+        ))
+        success_count = sum(results)
         
         if success_count > 0:
             logger.info(f"Posted to {success_count}/{len(self.webhook_urls)} Discord channels")
             return True
         else:
             logger.error("Failed to post to any Discord channels")
-            return False
\ No newline at end of file
+            return False
+    
+    def close(self):
+        """Close pooled webhook connections"""
+        self.session.close()
\ No newline at end of file
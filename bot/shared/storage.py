@@ -5,39 +5,103 @@ Message storage for tracking seen messages
 
 import json
 import logging
-from typing import Set
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Iterable, List
 
 logger = logging.getLogger(__name__)
 
+# Number of most recent message IDs to remember
+MAX_SEEN = 2000
+
+# Rewrite the snapshot and truncate the log after this many appended IDs
+COMPACT_EVERY = 500
+
+def read_ids(path: str) -> List[str]:
+    """Read IDs from a newline-delimited file (or a legacy JSON array)"""
+    with open(path, 'r') as f:
+        content = f.read()
+
+    if content.lstrip().startswith('['):
+        return json.loads(content)
+
+    return [line for line in content.split('\n') if line]
+
+def write_ids(path: str, ids: Iterable[str]):
+    """Atomically replace path with one ID per line"""
+    # Write a synced temporary file and swap it in so a crash never leaves a torn file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        # mkstemp creates 0600; keep the usual 0644
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'w') as f:
+            f.writelines(f"{item}\n" for item in ids)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
 class MessageStorage:
     """Handles storage of seen message IDs"""
     
+    __slots__ = ('file_path', 'log_path', 'seen_messages', '_log', '_log_count')
+    
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.seen_messages: Set[str] = set()
+        self.log_path = f"{file_path}.log"
+        # Insertion ordered so the oldest ID is evicted first
+        self.seen_messages: "OrderedDict[str, None]" = OrderedDict()
+        self._log = None
+        self._log_count = 0
         
     def load(self):
-        """Load seen messages from file"""
+        """Load seen messages from the snapshot and replay the append log"""
         try:
-            with open(self.file_path, 'r') as f:
-                seen_list = json.load(f)
-                self.seen_messages = set(seen_list)
-                logger.info(f"📋 Loaded {len(self.seen_messages)} seen messages")
+            self.seen_messages = OrderedDict()
+            for message_id in read_ids(self.file_path):
+                self._remember(message_id)
+            logger.info(f"📋 Loaded {len(self.seen_messages)} seen messages")
         except FileNotFoundError:
             logger.info("📋 No previous seen messages file, starting fresh")
         except json.JSONDecodeError:
             logger.warning("⚠️ Error reading seen messages file, starting fresh")
             
+        # Replay IDs appended since the last snapshot
+        try:
+            for message_id in read_ids(self.log_path):
+                self._remember(message_id)
+        except FileNotFoundError:
+            pass
+            
+        # Line buffered so each new ID reaches the file with a single write
+        self._log = open(self.log_path, 'a', buffering=1)
+        self._log_count = 0
+            
     def save(self):
-        """Save seen messages to file"""
-        seen_list = list(self.seen_messages)
-        # Keep only most recent 2000 to prevent file growth
-        if len(seen_list) > 2000:
-            seen_list = seen_list[-2000:]
-            self.seen_messages = set(seen_list)
+        """Write a snapshot of seen messages and truncate the log"""
+        # Oldest first, in the same one-ID-per-line format as the log
+        write_ids(self.file_path, self.seen_messages)
+        
+        # The snapshot now covers everything in the log
+        if self._log:
+            self._log.truncate(0)
+        self._log_count = 0
             
-        with open(self.file_path, 'w') as f:
-            json.dump(seen_list, f, indent=2)
+    def close(self):
+        """Close the append log"""
+        if self._log:
+            self._log.close()
+            self._log = None
+            
+    def _remember(self, message_id: str):
+        """Record message ID, evicting the oldest beyond MAX_SEEN"""
+        self.seen_messages[message_id] = None
+        self.seen_messages.move_to_end(message_id)
+        if len(self.seen_messages) > MAX_SEEN:
+            self.seen_messages.popitem(last=False)
             
     def is_seen(self, message_id: str) -> bool:
         """Check if message has been seen"""
@@ -45,8 +109,16 @@ class MessageStorage:
         
     def mark_seen(self, message_id: str):
         """Mark message as seen"""
-        self.seen_messages.add(message_id)
+        if message_id in self.seen_messages:
+            return
+            
+        self._remember(message_id)
         
-        # Periodic save
-        if len(self.seen_messages) % 20 == 0:
-            self.save()
\ No newline at end of file
+        # Append the new ID instead of rewriting the whole file
+        if self._log:
+            self._log.write(f"{message_id}\n")
+            self._log_count += 1
+            
+            # Periodic compaction
+            if self._log_count >= COMPACT_EVERY:
+                self.save()
\ No newline at end of file
@@ -5,6 +5,7 @@ Telegram source for transfer news
 
 import asyncio
 import logging
+import re
 from datetime import datetime
 from typing import Dict, Any, Callable
 from telethon import TelegramClient
@@ -12,6 +13,9 @@ from .base import TransferSource
 
 logger = logging.getLogger(__name__)
 
+# Broken telegra.ph image links like [\u200b\u200b](https://telegra.ph/file/...)
+TELEGRAPH_LINK_RE = re.compile(r'\[\u200b\u200b\]\(https://telegra\.ph/file/[^)]+\)')
+
 class TelegramSource(TransferSource):
     """Telegram channel source for transfer news"""
     
@@ -22,6 +26,7 @@ class TelegramSource(TransferSource):
         self.phone = phone
         self.channel_username = channel_username
         self.client = None
+        self._channel = None
         
     async def connect(self):
         """Connect to Telegram"""
@@ -30,12 +35,18 @@ class TelegramSource(TransferSource):
         await self.client.start(phone=self.phone)
         logger.info("✅ Connected to Telegram")
         
-    async def fetch_recent_messages(self, limit: int = 1):
+    async def _get_channel(self):
+        """Resolve the channel entity once and reuse it"""
+        if self._channel is None:
+            self._channel = await self.client.get_entity(self.channel_username)
+        return self._channel
+        
+    async def fetch_recent_messages(self, limit: int = 50):
         """Fetch recent messages for initial check"""
         logger.info(f"📥 Fetching last {limit} messages from @{self.channel_username}")
         
         try:
-            channel = await self.client.get_entity(self.channel_username)
+            channel = await self._get_channel()
             messages = []
             
             async for message in self.client.iter_messages(channel, limit=limit):
@@ -58,7 +69,7 @@ class TelegramSource(TransferSource):
             from telethon import events
             
             # Get channel entity
-            channel = await self.client.get_entity(self.channel_username)
+            channel = await self._get_channel()
             
             # Define event handler for new messages
             @self.client.on(events.NewMessage(chats=channel))
@@ -81,9 +92,7 @@ class TelegramSource(TransferSource):
         # Clean up the message text by removing broken telegra.ph links
         clean_text = message.text
         if clean_text:
-            # Remove telegra.ph link patterns like [​​](https://telegra.ph/file/...)
-            import re
-            clean_text = re.sub(r'\[​​\]\(https://telegra\.ph/file/[^)]+\)', '', clean_text)
+            clean_text = TELEGRAPH_LINK_RE.sub('', clean_text)
             clean_text = clean_text.strip()
         
         return {
@@ -4,14 +4,20 @@ Multi-Club Reddit Transfer Bot
 Monitors multiple football subreddits for Tier 1 and Tier 2 transfer posts and sends to Discord
 """
 
+import ahocorasick
 import praw
 import requests
 import json
 import time
 import os
-from datetime import datetime
+import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from typing import Set, Dict, List
+from bot.shared.storage import read_ids, write_ids
+from typing import Dict, List
 import logging
 
 # Load environment variables from .env file
@@ -21,6 +27,104 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Keywords that mark a post as transfer related
+TRANSFER_KEYWORDS = frozenset([
+    'transfer', 'signing', 'signs', 'joins', 'agreement', 'deal',
+    'contract', 'move', 'bid', 'offer', 'target', 'rumour', 'rumor',
+    'exclusive', 'breaking', 'confirmed', 'announces', 'loan',
+    'release clause', 'medical', 'here we go', 'done deal',
+    'official', 'unveil', 'welcome', 'new signing'
+])
+
+
+def build_keyword_automaton(keywords) -> ahocorasick.Automaton:
+    """Build an automaton that finds any of the keywords in a single pass"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+TRANSFER_AUTOMATON = build_keyword_automaton(TRANSFER_KEYWORDS)
+
+# Number of most recent submission IDs to remember
+MAX_SEEN_SUBMISSIONS = 2000
+
+# Fold the append log into the snapshot after this many new IDs
+SEEN_COMPACT_EVERY = 500
+
+# Attempts per webhook post when Discord answers 429 Too Many Requests
+WEBHOOK_MAX_ATTEMPTS = 4
+
+# Longest Retry-After worth waiting for; beyond this the post is given up so a long
+# (global or Cloudflare) ban cannot stall the stream loop
+WEBHOOK_MAX_RETRY_AFTER = 60
+
+# Stream reconnect backoff bounds, in seconds
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+
+# Discord accepts at most this many embeds in a single webhook message
+DISCORD_MAX_EMBEDS = 10
+
+# ...and at most this many characters of text across all of them
+DISCORD_MAX_EMBED_CHARS = 6000
+
+
+def build_webhook_session() -> requests.Session:
+    """Keep-alive session for Discord webhooks; 429s are handled in post_to_webhook"""
+    session = requests.Session()
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'User-Agent': os.getenv('REDDIT_USER_AGENT', 'multi_club_bot/1.0')
+    })
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=32,
+        # Only transient 5xx here; without respect_retry_after_header=False urllib3 would
+        # also retry (and parse Retry-After on) every 429 before post_to_webhook saw it
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['POST']),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+    ))
+    return session
+
+
+# One connection pool for every bot instance, so keep-alive connections to Discord are reused
+WEBHOOK_SESSION = build_webhook_session()
+
+
+def embed_text_length(embed: Dict) -> int:
+    """Characters Discord counts against the per-message embed limit"""
+    length = len(embed.get('title', '')) + len(embed.get('description', ''))
+    length += len(embed.get('footer', {}).get('text', '')) + len(embed.get('author', {}).get('name', ''))
+    for field in embed.get('fields', ()):
+        length += len(field['name']) + len(field['value'])
+    return length
+
+
+class SeenSubmissions(OrderedDict):
+    """Insertion-ordered set of submission IDs that evicts the oldest beyond a limit"""
+
+    def __init__(self, submission_ids=(), maxlen: int = MAX_SEEN_SUBMISSIONS):
+        super().__init__()
+        self.maxlen = maxlen
+        for submission_id in submission_ids:
+            self.add(submission_id)
+
+    def add(self, submission_id: str):
+        """Add an ID as the most recent, evicting the oldest when full"""
+        self[submission_id] = None
+        self.move_to_end(submission_id)
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
 
 class MultiClubRedditBot:
     def __init__(self):
@@ -31,18 +135,28 @@ class MultiClubRedditBot:
 
         # Discord webhooks - can be multiple separated by commas
         discord_webhooks_env = os.getenv('DISCORD_WEBHOOK_URL', '')
-        self.discord_webhooks = [url.strip() for url in discord_webhooks_env.split(',') if url.strip()]
+        self.discord_webhooks = [url for url in (part.strip() for part in discord_webhooks_env.split(',')) if url]
 
         # Validate required environment variables
         if not all([self.reddit_client_id, self.reddit_client_secret]) or not self.discord_webhooks:
             raise ValueError("Missing required environment variables. Check your .env file.")
 
+        # Worker threads so all webhooks are posted to in parallel
+        self.webhook_pool = ThreadPoolExecutor(max_workers=len(self.discord_webhooks))
+
+        # Keep-alive session shared by the workers (and every bot in this process)
+        self.http = WEBHOOK_SESSION
+
         # File to store seen submissions (use persistent path for Railway)
         self.seen_file = '/tmp/seen_submissions.json'
-        self.seen_submissions: Set[str] = set()
+        self.seen_submissions = SeenSubmissions()
+
+        # Append-only log of IDs seen since the last snapshot (opened on load)
+        self.seen_log = None
+        self.seen_log_count = 0
 
         # Target flairs - only high quality sources
-        self.target_flairs = ['Tier 1', 'Tier 2', 'Official Source']
+        self.target_flairs = frozenset(['Tier 1', 'Tier 2', 'Official Source'])
 
         # Club configurations
         self.clubs = {
@@ -96,17 +210,39 @@ class MultiClubRedditBot:
             }
         }
 
+        # Per-club embed parts that never change between submissions
+        self.embed_templates = {
+            club_key: {
+                "color": club_info['color'],
+                "footer": {
+                    "text": f"Multi-Club Transfer Bot • r/{club_key}"
+                },
+                "thumbnail": {
+                    "url": club_info['logo']
+                }
+            }
+            for club_key, club_info in self.clubs.items()
+        }
+
+        # Pick each subreddit's filter once instead of branching on every submission
+        self.filters = {club_key: self.passes_flair_filter for club_key in self.clubs}
+        self.filters['soccer'] = self.passes_soccer_filter
+
         # Initialize Reddit instance
         self.reddit = None
 
+    def create_reddit(self) -> praw.Reddit:
+        """Build a Reddit client from the configured credentials"""
+        return praw.Reddit(
+            client_id=self.reddit_client_id,
+            client_secret=self.reddit_client_secret,
+            user_agent=self.reddit_user_agent
+        )
+
     def connect_to_reddit(self):
         """Initialize Reddit connection"""
         try:
-            self.reddit = praw.Reddit(
-                client_id=self.reddit_client_id,
-                client_secret=self.reddit_client_secret,
-                user_agent=self.reddit_user_agent
-            )
+            self.reddit = self.create_reddit()
 
             # Test connection with Chelsea subreddit
             test_subreddit = self.reddit.subreddit('chelseafc')
@@ -117,67 +253,130 @@ class MultiClubRedditBot:
             raise
 
     def load_seen_submissions(self):
-        """Load previously seen submissions from file"""
+        """Load previously seen submissions from the snapshot and append log"""
         try:
-            with open(self.seen_file, 'r') as f:
-                seen_list = json.load(f)
-                self.seen_submissions = set(seen_list)
-                logger.info(f"📋 Loaded {len(self.seen_submissions)} seen submissions")
+            self.seen_submissions = SeenSubmissions(read_ids(self.seen_file))
+            logger.info(f"📋 Loaded {len(self.seen_submissions)} seen submissions")
         except FileNotFoundError:
             logger.info("📋 No previous seen submissions file, starting fresh")
-            self.seen_submissions = set()
+            self.seen_submissions = SeenSubmissions()
         except json.JSONDecodeError:
             logger.warning("⚠️ Error reading seen submissions file, starting fresh")
-            self.seen_submissions = set()
+            self.seen_submissions = SeenSubmissions()
+
+        # Submissions marked seen after the last save only made it into the log
+        try:
+            for submission_id in read_ids(f"{self.seen_file}.log"):
+                self.seen_submissions.add(submission_id)
+        except FileNotFoundError:
+            pass
+
+        # Line buffered so each new ID is a single small append
+        self.seen_log = open(f"{self.seen_file}.log", 'a', buffering=1)
+        self.seen_log_count = 0
 
     def save_seen_submissions(self):
-        """Save seen submissions to file"""
-        seen_list = list(self.seen_submissions)
-        # Keep only the most recent 2000 to prevent file from growing too large
-        if len(seen_list) > 2000:
-            seen_list = seen_list[-2000:]
-            self.seen_submissions = set(seen_list)
+        """Compact seen submissions into the snapshot file and truncate the log"""
+        # SeenSubmissions is already capped to the most recent IDs, oldest first
+        write_ids(self.seen_file, self.seen_submissions)
+
+        # Every logged submission is in the new snapshot, so start the log over
+        if self.seen_log:
+            self.seen_log.truncate(0)
+        self.seen_log_count = 0
 
-        with open(self.seen_file, 'w') as f:
-            json.dump(seen_list, f, indent=2)
+    def close_seen_log(self):
+        """Close the seen submissions append log"""
+        if self.seen_log:
+            self.seen_log.close()
+            self.seen_log = None
+
+    def mark_seen(self, submission_id: str):
+        """Record a submission as seen and append it to the log"""
+        self.seen_submissions.add(submission_id)
+
+        if self.seen_log:
+            self.seen_log.write(f"{submission_id}\n")
+            self.seen_log_count += 1
+
+            # Keep the log (and the replay on restart) short during long runs
+            if self.seen_log_count >= SEEN_COMPACT_EVERY:
+                self.save_seen_submissions()
 
     def is_transfer_related(self, title: str, text: str = '') -> bool:
         """Check if post is transfer related"""
-        content = f"{title} {text}".lower()
-        transfer_keywords = [
-            'transfer', 'signing', 'signs', 'joins', 'agreement', 'deal',
-            'contract', 'move', 'bid', 'offer', 'target', 'rumour', 'rumor',
-            'exclusive', 'breaking', 'confirmed', 'announces', 'loan',
-            'release clause', 'medical', 'here we go', 'done deal',
-            'official', 'unveil', 'welcome', 'new signing'
-        ]
+        # Check the short title first; only lowercase the body when the title has no keyword
+        if next(TRANSFER_AUTOMATON.iter(title.lower()), None) is not None:
+            return True
 
-        return any(keyword in content for keyword in transfer_keywords)
+        return bool(text) and next(TRANSFER_AUTOMATON.iter(text.lower()), None) is not None
 
-    def send_to_discord(self, submission, club_key: str):
-        """Send submission to Discord via webhook(s)"""
+    def rate_limit_delay(self, response, attempt: int) -> float:
+        """Seconds to wait after a 429: Retry-After if given, else exponential, plus jitter"""
+        retry_after = response.headers.get('Retry-After')
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = 2 ** attempt
+
+        return delay + random.uniform(0, 0.5)
+
+    def post_to_webhook(self, webhook_url: str, body: bytes) -> bool:
+        """Post a serialized payload to a single Discord webhook, backing off only when rate limited"""
+        for attempt in range(WEBHOOK_MAX_ATTEMPTS):
+            try:
+                response = self.http.post(
+                    webhook_url,
+                    data=body,
+                    timeout=10
+                )
+
+                # 204 normally, 200 when the webhook is called with ?wait=true
+                if 200 <= response.status_code < 300:
+                    return True
+
+                if response.status_code == 429 and attempt < WEBHOOK_MAX_ATTEMPTS - 1:
+                    delay = self.rate_limit_delay(response, attempt)
+                    if delay > WEBHOOK_MAX_RETRY_AFTER:
+                        logger.error("❌ Discord rate limited %s... for %.0fs, giving up", webhook_url[:50], delay)
+                        return False
+
+                    logger.warning("⏳ Discord rate limited %s..., retrying in %.1fs", webhook_url[:50], delay)
+                    time.sleep(delay)
+                    continue
+
+                logger.error("❌ Discord webhook failed: %s for %s...", response.status_code, webhook_url[:50])
+
+            except requests.RequestException as e:
+                logger.error("❌ Error posting to Discord webhook %s...: %s", webhook_url[:50], e)
+
+            return False
+
+    def build_embed(self, submission, club_key: str) -> Dict:
+        """Build the Discord embed for a submission"""
         club_info = self.clubs[club_key]
 
-        # Determine tier and color
+        # Determine tier
         tier = submission.link_flair_text or "News"
-        color = club_info['color']
 
         # Get submission details
         title = submission.title
         url = submission.url
         reddit_url = f"https://reddit.com{submission.permalink}"
-        author = str(submission.author) if submission.author else "Unknown"
-        created_time = datetime.fromtimestamp(submission.created_utc)
+        author = submission.author
+        author = str(author) if author else "Unknown"
+        # Discord wants ISO 8601; format straight from the UTC epoch without a datetime object
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(submission.created_utc))
 
         # Truncate title if too long
         if len(title) > 200:
             title = title[:197] + "..."
 
-        # Create embed
+        # Create embed from the club's prebuilt template
         embed = {
+            **self.embed_templates[club_key],
             "title": f"{club_info['emoji']} {tier} - {club_info['name']}",
             "description": title,
-            "color": color,
             "fields": [
                 {
                     "name": "Source",
@@ -205,13 +404,7 @@ class MultiClubRedditBot:
                     "inline": True
                 }
             ],
-            "timestamp": created_time.isoformat(),
-            "footer": {
-                "text": f"Multi-Club Transfer Bot • r/{club_key}"
-            },
-            "thumbnail": {
-                "url": club_info['logo']
-            }
+            "timestamp": timestamp
         }
 
         # Add score field if this is from r/soccer
@@ -222,98 +415,157 @@ class MultiClubRedditBot:
                 "inline": True
             })
 
+        return embed
+
+    def send_embeds(self, embeds: List[Dict]) -> int:
+        """Post embeds as one message; returns the number of webhooks that accepted it"""
         payload = {
-            "embeds": [embed]
+            "embeds": embeds
         }
 
-        # Send to all configured webhooks
-        success_count = 0
-        for webhook_url in self.discord_webhooks:
-            try:
-                response = requests.post(
-                    webhook_url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=10
-                )
+        # One encoded body for the whole batch, posted unchanged to each webhook
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
 
-                if response.status_code == 204:
-                    success_count += 1
-                else:
-                    logger.error(f"❌ Discord webhook failed: {response.status_code} for {webhook_url[:50]}...")
+        # Send to all configured webhooks concurrently
+        results = self.webhook_pool.map(lambda webhook_url: self.post_to_webhook(webhook_url, body),
+                                        self.discord_webhooks)
+        return sum(results)
 
-            except requests.RequestException as e:
-                logger.error(f"❌ Error posting to Discord webhook {webhook_url[:50]}...: {e}")
+    def send_to_discord(self, submission, club_key: str):
+        """Send submission to Discord via webhook(s)"""
+        embed = self.build_embed(submission, club_key)
+        success_count = self.send_embeds([embed])
 
         if success_count > 0:
-            logger.info(
-                f"✅ Posted to {success_count}/{len(self.discord_webhooks)} Discord channels: [{club_info['name']}] {title[:50]}...")
+            logger.info("✅ Posted to %d/%d Discord channels: [%s] %s...", success_count,
+                        len(self.discord_webhooks), self.clubs[club_key]['name'], embed['description'][:50])
             return True
         else:
-            logger.error(f"❌ Failed to post to any Discord channels")
+            logger.error("❌ Failed to post to any Discord channels")
             return False
 
-    def process_submission(self, submission, club_key: str):
-        """Process a single submission"""
-        # Skip if already seen
-        if submission.id in self.seen_submissions:
+    def batch_embeds(self, embeds: List[Dict]) -> List[List[Dict]]:
+        """Split embeds into messages within both the embed count and embed text limits"""
+        batches = []
+        batch = []
+        batch_chars = 0
+
+        for embed in embeds:
+            embed_chars = embed_text_length(embed)
+
+            # Close the batch before it would be rejected as a whole
+            if batch and (len(batch) >= DISCORD_MAX_EMBEDS or batch_chars + embed_chars > DISCORD_MAX_EMBED_CHARS):
+                batches.append(batch)
+                batch = []
+                batch_chars = 0
+
+            batch.append(embed)
+            batch_chars += embed_chars
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def flush_embeds(self, pending: List[Dict]) -> int:
+        """Post queued embeds in batches within Discord's limits; returns the number of batches delivered"""
+        delivered = 0
+
+        for batch in self.batch_embeds(pending):
+            success_count = self.send_embeds(batch)
+
+            if success_count > 0:
+                delivered += 1
+                logger.info("✅ Posted %d embeds to %d/%d Discord channels", len(batch), success_count,
+                            len(self.discord_webhooks))
+            else:
+                logger.error("❌ Failed to post %d embeds to any Discord channels", len(batch))
+
+        pending.clear()
+        return delivered
+
+    def passes_flair_filter(self, submission, flair: str, title: str) -> bool:
+        """Club subreddits: ONLY check flair (strict filtering)"""
+        # Must have Tier 1, Tier 2, or Official Source flair
+        return flair in self.target_flairs
+
+    def passes_soccer_filter(self, submission, flair: str, title: str) -> bool:
+        """r/soccer: require transfer keywords AND a high score"""
+        if not self.is_transfer_related(title, getattr(submission, 'selftext', '')):
             return False
 
-        # For club-specific subreddits, ONLY check flair (strict filtering)
-        if club_key != 'soccer':
-            # Must have Tier 1, Tier 2, or Official Source flair
-            if submission.link_flair_text not in self.target_flairs:
-                self.seen_submissions.add(submission.id)
-                return False
-        else:
-            # For r/soccer, check transfer keywords AND require high score
-            if not self.is_transfer_related(submission.title, getattr(submission, 'selftext', '')):
-                self.seen_submissions.add(submission.id)
-                return False
+        # Only post r/soccer posts with high upvotes AND tier flair if available
+        if submission.score < 100:  # Increased threshold
+            return False
 
-            # Only post r/soccer posts with high upvotes AND tier flair if available
-            if submission.score < 100:  # Increased threshold
-                self.seen_submissions.add(submission.id)
+        # If r/soccer post has a flair, it must be a good one
+        if flair and flair not in self.target_flairs:
+            # Skip if it has a flair but it's not Tier 1/2/Official
+            if 'tier' in flair.lower():
                 return False
 
-            # If r/soccer post has a flair, it must be a good one
-            if submission.link_flair_text and submission.link_flair_text not in self.target_flairs:
-                # Skip if it has a flair but it's not Tier 1/2/Official
-                if 'tier' in submission.link_flair_text.lower():
-                    self.seen_submissions.add(submission.id)
-                    return False
+        return True
+
+    def process_submission(self, submission, club_key: str, pending: List[Dict] = None):
+        """Process a single submission; queue its embed on `pending` instead of posting when given"""
+        # Skip if already seen (read nothing else from the submission first)
+        submission_id = submission.id
+        if submission_id in self.seen_submissions:
+            return False
+
+        # Read each attribute once; PRAW may lazily fetch on first access
+        flair = submission.link_flair_text
+        title = submission.title
+
+        # Flair-only for club subreddits, keywords + score for r/soccer
+        if not self.filters[club_key](submission, flair, title):
+            self.mark_seen(submission_id)
+            return False
 
         # Log the submission
-        tier = submission.link_flair_text or "News"
-        logger.info(f"📢 Found {tier} post in r/{club_key}: {submission.title[:50]}...")
+        tier = flair or "News"
+        logger.info("📢 Found %s post in r/%s: %s...", tier, club_key, title[:50])
 
-        # Send to Discord
-        success = self.send_to_discord(submission, club_key)
+        # Send to Discord, or leave it for the caller to post in a batch
+        if pending is not None:
+            pending.append(self.build_embed(submission, club_key))
+            success = True
+        else:
+            success = self.send_to_discord(submission, club_key)
 
         # Mark as seen regardless of Discord success
-        self.seen_submissions.add(submission.id)
-
-        # Save seen submissions periodically
-        if len(self.seen_submissions) % 20 == 0:
-            self.save_seen_submissions()
+        self.mark_seen(submission_id)
 
         return success
 
-    def check_recent_posts(self, club_key: str, limit: int = 10):
+    def fetch_recent_posts(self, club_key: str, limit: int = 10, reddit: praw.Reddit = None) -> List:
+        """Fetch the newest posts of a subreddit, optionally through a separate Reddit client"""
+        reddit = reddit or self.reddit
+        try:
+            return list(reddit.subreddit(club_key).new(limit=limit))
+        except Exception as e:
+            logger.error(f"❌ Error fetching r/{club_key}: {e}")
+            return []
+
+    def check_recent_posts(self, club_key: str, limit: int = 10, submissions: List = None,
+                           pending: List[Dict] = None):
         """Check recent posts for any missed Tier 1/2 posts"""
         logger.info(f"🔍 Checking last {limit} posts in r/{club_key}...")
 
         try:
-            subreddit = self.reddit.subreddit(club_key)
+            # Use already fetched posts when given, otherwise fetch them now
+            if submissions is None:
+                submissions = self.fetch_recent_posts(club_key, limit)
+
             found_count = 0
 
-            for submission in subreddit.new(limit=limit):
-                if self.process_submission(submission, club_key):
+            for submission in submissions:
+                if self.process_submission(submission, club_key, pending):
                     found_count += 1
-                    time.sleep(1)  # Small delay between Discord posts
 
             if found_count > 0:
-                logger.info(f"✅ Posted {found_count} items from r/{club_key}")
+                action = "Queued" if pending is not None else "Posted"
+                logger.info(f"✅ {action} {found_count} items from r/{club_key}")
 
         except Exception as e:
             logger.error(f"❌ Error checking r/{club_key}: {e}")
@@ -334,6 +586,8 @@ class MultiClubRedditBot:
         """Monitor all configured subreddits"""
         logger.info("🚀 Starting live monitoring of all subreddits...")
 
+        reconnect_delay = RECONNECT_BASE_DELAY
+
         while True:
             try:
                 # Create a multireddit string
@@ -343,6 +597,9 @@ class MultiClubRedditBot:
                 logger.info(f"📡 Monitoring: {subreddit_names}")
 
                 for submission in multireddit.stream.submissions(skip_existing=True):
+                    # The stream is healthy again, so the next failure starts from a short delay
+                    reconnect_delay = RECONNECT_BASE_DELAY
+
                     # Determine which subreddit this came from
                     club_key = submission.subreddit.display_name.lower()
 
@@ -354,16 +611,18 @@ class MultiClubRedditBot:
 
             except Exception as e:
                 logger.error(f"❌ Stream error: {e}")
-                logger.info("🔄 Reconnecting in 30 seconds...")
-                time.sleep(30)
 
-                # Try to reconnect to Reddit
+                # Exponential backoff with jitter: quick after a blip, capped during an outage
+                delay = reconnect_delay + random.uniform(0, 1)
+                reconnect_delay = min(RECONNECT_MAX_DELAY, reconnect_delay * 2)
+                logger.info(f"🔄 Reconnecting in {delay:.1f} seconds...")
+                time.sleep(delay)
+
+                # Try to reconnect to Reddit; a failure just backs off further on the next pass
                 try:
                     self.connect_to_reddit()
                 except Exception as reconnect_error:
                     logger.error(f"❌ Reconnection failed: {reconnect_error}")
-                    logger.info("⏳ Waiting 60 seconds before retry...")
-                    time.sleep(60)
 
     def run(self):
         """Main run method"""
@@ -379,6 +638,7 @@ class MultiClubRedditBot:
         # Check recent posts for each subreddit (skip Chelsea since it's most active)
         broken_subreddits = ['gunners', 'liverpoolfc', 'mcfc']  # Previously broken due to case mismatch
 
+        sweep_limits = {}
         for club_key in self.clubs.keys():
             if club_key == 'chelseafc':
                 logger.info(f"⏭️ Skipping initial check for r/{club_key} (most active)")
@@ -391,8 +651,20 @@ class MultiClubRedditBot:
             else:
                 limit = 1
 
-            self.check_recent_posts(club_key, limit=limit)
-            time.sleep(2)  # Delay between subreddits
+            sweep_limits[club_key] = limit
+
+        # Fetch every subreddit's listing in parallel, then process them in order on this
+        # thread so seen_submissions is only ever touched from one thread. PRAW clients are
+        # not thread-safe, so each fetch gets its own client instead of sharing self.reddit
+        pending_embeds = []
+        with ThreadPoolExecutor(max_workers=len(sweep_limits)) as pool:
+            fetched = pool.map(lambda item: self.fetch_recent_posts(*item, reddit=self.create_reddit()),
+                               sweep_limits.items())
+            for (club_key, limit), submissions in zip(sweep_limits.items(), fetched):
+                self.check_recent_posts(club_key, limit=limit, submissions=submissions, pending=pending_embeds)
+
+        # Post everything the sweep found in as few webhook messages as possible
+        self.flush_embeds(pending_embeds)
 
         # Save seen submissions after initial check
         self.save_seen_submissions()
@@ -404,6 +676,7 @@ class MultiClubRedditBot:
             logger.info("👋 Bot stopped by user")
         finally:
             self.save_seen_submissions()
+            self.close_seen_log()
             logger.info("💾 Saved seen submissions")
 
 
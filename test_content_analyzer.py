@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Telegram bot's content analysis and club detection
+"""
+
+import unittest
+
+from bot.shared.club_configs import detect_clubs
+from bot.shared.content_analyzer import Analysis, ContentAnalyzer
+
+
+class TestDetectClubs(unittest.TestCase):
+
+    def test_single_club(self):
+        """Test detecting one club by any of its keywords, case-insensitively"""
+        self.assertEqual(detect_clubs('Chelsea agree fee'), ['chelsea'])
+        self.assertEqual(detect_clubs('Talks at STAMFORD BRIDGE'), ['chelsea'])
+        self.assertEqual(detect_clubs('COYS!'), ['tottenham'])
+
+    def test_clubs_in_config_order(self):
+        """Test that clubs come back in CLUB_CONFIGS order, not text order"""
+        self.assertEqual(detect_clubs('Arsenal beat Chelsea'), ['chelsea', 'arsenal'])
+        self.assertEqual(detect_clubs('Real Madrid and Man City talks'), ['man_city', 'real_madrid'])
+
+    def test_each_club_once(self):
+        """Test that several keywords of one club only report it once"""
+        self.assertEqual(detect_clubs('Chelsea, the Blues, at Stamford Bridge'), ['chelsea'])
+
+    def test_no_clubs(self):
+        """Test text without any club keyword"""
+        self.assertEqual(detect_clubs('Transfer window opens today'), [])
+
+    def test_precomputed_lowercase(self):
+        """Test that a caller's lowercased text is used as given"""
+        self.assertEqual(detect_clubs('ignored', 'barca want a striker'), ['barcelona'])
+
+
+class TestContentAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.analyzer = ContentAnalyzer()
+
+    def test_analyze_tier_1_high_confidence(self):
+        """Test a Tier 1 'here we go' transfer message"""
+        analysis = self.analyzer.analyze('Fabrizio Romano: Chelsea here we go, deal done')
+
+        self.assertEqual(analysis, Analysis(
+            is_spam=False, source_tier=1, confidence='high', is_transfer_related=True, clubs=['chelsea']
+        ))
+
+    def test_source_tier(self):
+        """Test Tier 1 beating Tier 2, and Tier 3 when no source matches"""
+        self.assertEqual(self.analyzer.analyze('Fabrizio Romano and Di Marzio: Chelsea deal').source_tier, 1)
+        self.assertEqual(self.analyzer.analyze('Di Marzio: Chelsea deal').source_tier, 2)
+        self.assertEqual(self.analyzer.analyze('Chelsea deal').source_tier, 3)
+
+    def test_tier_2_as_matches_as_substring(self):
+        """Test that the Tier 2 source 'as' matches inside words, as it always has"""
+        self.assertEqual(self.analyzer.analyze('Chelsea player has a new deal').source_tier, 2)
+
+    def test_confidence_order(self):
+        """Test high beating medium, and low without any transfer keyword"""
+        self.assertEqual(self.analyzer.analyze('Here we go: Chelsea deal').confidence, 'high')
+        self.assertEqual(self.analyzer.analyze('Chelsea open talks on a deal').confidence, 'medium')
+        self.assertEqual(self.analyzer.analyze('Chelsea training update').confidence, 'low')
+
+    def test_spam(self):
+        """Test spam indicators anywhere in the text"""
+        self.assertTrue(self.analyzer.analyze('Chelsea deal - claim your BONUS now').is_spam)
+        self.assertFalse(self.analyzer.analyze('Chelsea deal').is_spam)
+
+    def test_single_checks_agree_with_analyze(self):
+        """Test that the single-purpose checks give the same answers as analyze"""
+        for text in ['Fabrizio Romano: Chelsea here we go, deal done',
+                     'Di Marzio: Arsenal open talks',
+                     'Chelsea training update',
+                     'Free spins casino']:
+            analysis = self.analyzer.analyze(text)
+            self.assertEqual(self.analyzer.is_spam(text), analysis.is_spam, text)
+            self.assertEqual(self.analyzer.get_source_tier(text), analysis.source_tier, text)
+            self.assertEqual(self.analyzer.get_confidence_level(text), analysis.confidence, text)
+            self.assertEqual(self.analyzer.is_transfer_related(text), analysis.is_transfer_related, text)
+
+    def test_should_post(self):
+        """Test the posting rules for each combination of confidence and tier"""
+        cases = [
+            ('Fabrizio Romano: Chelsea here we go, deal done', True),   # high, Tier 1
+            ('Di Marzio: Chelsea here we go on a deal', True),          # high, Tier 2
+            ('Chelsea here we go on a deal', False),                    # high, Tier 3
+            ('Fabrizio Romano: Chelsea player joins on loan', True),    # medium, Tier 1
+            ('Di Marzio: Chelsea open talks on a deal', False),         # medium, Tier 2
+            ('Fabrizio Romano: Chelsea training update', False),        # not transfer related
+            ('Fabrizio Romano: here we go, deal for the striker', False),  # no club
+            ('Fabrizio Romano: Chelsea bonus deal', False),             # spam
+        ]
+
+        results = [self.analyzer.should_post(self.analyzer.analyze(text)) for text, _ in cases]
+        self.assertEqual(results, [expected for _, expected in cases])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Telegram bot's Discord sender and per-club fan-out
+"""
+
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import json
+import threading
+
+from bot.main import TransferBot
+from bot.shared.club_configs import CLUB_CONFIGS
+from bot.shared.discord_sender import DiscordSender
+
+WEBHOOKS = ['https://discord.com/api/webhooks/123/abc', 'https://discord.com/api/webhooks/456/def']
+
+MESSAGE = {'id': 'msg1', 'title': 'Chelsea agree deal', 'timestamp': '2024-01-01T00:00:00'}
+
+
+def response(status_code):
+    """Build a stand-in HTTP response"""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    return mock_response
+
+
+class TestDiscordSender(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.sender = DiscordSender(WEBHOOKS)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.sender.close()
+
+    def send(self):
+        """Send MESSAGE for Chelsea and return the result"""
+        return asyncio.run(self.sender.send_message(MESSAGE, 'chelsea', CLUB_CONFIGS['chelsea']))
+
+    @patch('requests.Session.post')
+    def test_send_posts_to_every_webhook_concurrently(self, mock_post):
+        """Test that all webhooks are posted to at once with one shared body"""
+        # Each post waits for the other, so a sequential fan-out would time out here
+        barrier = threading.Barrier(len(WEBHOOKS), timeout=5)
+
+        def post(url, **kwargs):
+            barrier.wait()
+            return response(204)
+
+        mock_post.side_effect = post
+
+        self.assertTrue(self.send())
+
+        self.assertEqual(sorted(call.args[0] for call in mock_post.call_args_list), WEBHOOKS)
+        bodies = {call.kwargs['data'] for call in mock_post.call_args_list}
+        self.assertEqual(len(bodies), 1)
+
+        embed = json.loads(bodies.pop())['embeds'][0]
+        self.assertEqual(embed['title'], '🔵 Chelsea FC')
+        self.assertEqual(embed['description'], 'Chelsea agree deal')
+        self.assertEqual(embed['timestamp'], '2024-01-01T00:00:00')
+
+    @patch('requests.Session.post')
+    def test_send_partial_failure(self, mock_post):
+        """Test that one accepted webhook is enough"""
+        mock_post.side_effect = [response(204), response(400)]
+
+        self.assertTrue(self.send())
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('requests.Session.post')
+    def test_send_all_fail(self, mock_post):
+        """Test that the send fails when no webhook accepts it"""
+        mock_post.return_value = response(400)
+
+        self.assertFalse(self.send())
+        self.assertEqual(mock_post.call_count, 2)
+
+    def test_pool_sized_for_club_fan_out(self):
+        """Test that the connection pool can hold every club x webhook post at once"""
+        adapter = self.sender.session.get_adapter(WEBHOOKS[0])
+        self.assertEqual(adapter._pool_maxsize, len(WEBHOOKS) * len(CLUB_CONFIGS))
+
+
+class TestProcessMessageFanOut(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.bot = TransferBot()
+        self.bot.discord_sender.close()
+        self.bot.discord_sender = Mock()
+        self.bot.discord_sender.send_message = AsyncMock(return_value=True)
+
+    def test_posts_once_per_detected_club(self):
+        """Test that a message naming several clubs is sent for each of them"""
+        message = {'id': 'msg1', 'text': 'Fabrizio Romano: Arsenal and Chelsea agree swap deal'}
+
+        self.assertTrue(asyncio.run(self.bot.process_message(message)))
+
+        club_keys = [call.args[1] for call in self.bot.discord_sender.send_message.await_args_list]
+        self.assertEqual(club_keys, ['chelsea', 'arsenal'])
+        self.assertEqual(message['source_tier'], 'Tier 1')
+        self.assertTrue(self.bot.storage.is_seen('msg1'))
+
+    def test_one_club_failing_does_not_stop_the_others(self):
+        """Test that an exception for one club is logged while the others are still sent"""
+        self.bot.discord_sender.send_message.side_effect = [RuntimeError('boom'), True]
+        message = {'id': 'msg2', 'text': 'Fabrizio Romano: Arsenal and Chelsea agree swap deal'}
+
+        self.assertTrue(asyncio.run(self.bot.process_message(message)))
+        self.assertEqual(self.bot.discord_sender.send_message.await_count, 2)
+
+    def test_skips_seen_messages(self):
+        """Test that a seen message is not analyzed or sent again"""
+        self.bot.storage.mark_seen('msg3')
+        message = {'id': 'msg3', 'text': 'Fabrizio Romano: Chelsea here we go, deal done'}
+
+        self.assertFalse(asyncio.run(self.bot.process_message(message)))
+        self.bot.discord_sender.send_message.assert_not_awaited()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -5,8 +5,11 @@ Unit tests for Multi-Club Reddit Transfer Bot
 
 import unittest
 from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, HTTPServer
 import json
 import tempfile
+import threading
 import os
 
 # We need to mock the environment before importing the bot
@@ -16,7 +19,48 @@ os.environ['REDDIT_USER_AGENT'] = 'test_bot/1.0'
 os.environ['DISCORD_WEBHOOK_URL'] = 'https://discord.com/api/webhooks/123/abc,https://discord.com/api/webhooks/456/def'
 
 # Import the bot class after setting environment
-from reddit_bot import MultiClubRedditBot
+import reddit_bot
+from reddit_bot import MultiClubRedditBot, SeenSubmissions
+
+
+def make_submission(**attrs):
+    """Build a lightweight stand-in for a PRAW submission"""
+    fields = {
+        'id': 'test_sub',
+        'title': 'Test news',
+        'url': 'https://test.com',
+        'permalink': '/r/test/123',
+        'author': 'testuser',
+        'created_utc': 1640995200,
+        'link_flair_text': 'Tier 1',
+        'score': 0,
+        'selftext': ''
+    }
+    fields.update(attrs)
+    return SimpleNamespace(**fields)
+
+
+def start_webhook_stub(responses):
+    """Serve queued (status, headers) responses on localhost, repeating the last one"""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            received.append(self.path)
+            status, headers = responses[min(len(received), len(responses)) - 1]
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/api/webhooks/123/abc", received
 
 
 class TestMultiClubRedditBot(unittest.TestCase):
@@ -27,15 +71,17 @@ class TestMultiClubRedditBot(unittest.TestCase):
         self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
         self.temp_file.close()
 
-        # Initialize bot
+        # Initialize bot (cheap: the webhook session is shared at module level)
         self.bot = MultiClubRedditBot()
         self.bot.seen_file = self.temp_file.name
-        self.bot.seen_submissions = set()
+        self.bot.seen_submissions = SeenSubmissions()
 
     def tearDown(self):
         """Clean up after each test method."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        self.bot.close_seen_log()
+        for path in (self.temp_file.name, self.temp_file.name + '.log'):
+            if os.path.exists(path):
+                os.unlink(path)
 
     def test_webhook_parsing_multiple(self):
         """Test parsing multiple webhook URLs"""
@@ -58,6 +104,12 @@ class TestMultiClubRedditBot(unittest.TestCase):
             self.assertIn('https://url1.com', bot.discord_webhooks)
             self.assertIn('https://url2.com', bot.discord_webhooks)
 
+    def test_webhook_session_shared(self):
+        """Test that every bot posts through the same pooled session"""
+        bot = MultiClubRedditBot()
+        self.assertIs(bot.http, self.bot.http)
+        self.assertEqual(bot.http.headers['Content-Type'], 'application/json')
+
     def test_missing_credentials_raises_error(self):
         """Test that missing credentials raise ValueError"""
         with patch.dict(os.environ, {}, clear=True):
@@ -74,9 +126,8 @@ class TestMultiClubRedditBot(unittest.TestCase):
             "Done deal - Tottenham loan agreement confirmed"
         ]
 
-        for case in positive_cases:
-            with self.subTest(case=case):
-                self.assertTrue(self.bot.is_transfer_related(case))
+        results = [self.bot.is_transfer_related(case) for case in positive_cases]
+        self.assertTrue(all(results), msg=[case for case, result in zip(positive_cases, results) if not result])
 
     def test_transfer_detection_negative(self):
         """Test transfer keyword detection - negative cases"""
@@ -88,9 +139,8 @@ class TestMultiClubRedditBot(unittest.TestCase):
             "Youth team graduation ceremony"
         ]
 
-        for case in negative_cases:
-            with self.subTest(case=case):
-                self.assertFalse(self.bot.is_transfer_related(case))
+        results = [self.bot.is_transfer_related(case) for case in negative_cases]
+        self.assertFalse(any(results), msg=[case for case, result in zip(negative_cases, results) if result])
 
     def test_load_submissions_empty_file(self):
         """Test loading when no file exists"""
@@ -104,43 +154,92 @@ class TestMultiClubRedditBot(unittest.TestCase):
         """Test loading existing submissions"""
         test_data = ['sub1', 'sub2', 'sub3']
         with open(self.temp_file.name, 'w') as f:
-            json.dump(test_data, f)
+            f.write('sub1\nsub2\nsub3\n')
 
         self.bot.load_seen_submissions()
         self.assertEqual(len(self.bot.seen_submissions), 3)
-        for item in test_data:
-            self.assertIn(item, self.bot.seen_submissions)
+        self.assertTrue(set(test_data).issubset(self.bot.seen_submissions))
 
     def test_save_submissions(self):
         """Test saving submissions to file"""
-        test_data = {'sub1', 'sub2', 'sub3'}
-        self.bot.seen_submissions = test_data
+        test_data = ['sub1', 'sub2', 'sub3']
+        self.bot.seen_submissions = SeenSubmissions(test_data)
 
         self.bot.save_seen_submissions()
 
-        # Verify data was saved
+        # Verify data was saved, oldest first
         with open(self.temp_file.name, 'r') as f:
-            saved_data = json.load(f)
+            saved_data = f.read().split()
 
-        self.assertEqual(len(saved_data), 3)
-        for item in test_data:
-            self.assertIn(item, saved_data)
+        self.assertEqual(saved_data, test_data)
 
     def test_save_submissions_truncation(self):
-        """Test that large submission lists are truncated"""
-        # Create more than 2000 submissions
-        large_set = {f'sub_{i}' for i in range(2500)}
-        self.bot.seen_submissions = large_set
+        """Test that only the 2000 most recent submissions are kept and saved"""
+        # See more than 2000 submissions
+        for i in range(2500):
+            self.bot.mark_seen(f'sub_{i}')
 
         self.bot.save_seen_submissions()
 
-        # Should be truncated to 2000
-        self.assertEqual(len(self.bot.seen_submissions), 2000)
+        # The oldest 500 are evicted; the newest 2000 survive in order
+        expected = [f'sub_{i}' for i in range(500, 2500)]
+        self.assertEqual(list(self.bot.seen_submissions), expected)
+        with open(self.temp_file.name, 'r') as f:
+            self.assertEqual(f.read().split(), expected)
+
+    def test_load_submissions_replays_log(self):
+        """Test that IDs appended to the log are loaded on top of a legacy JSON snapshot"""
+        with open(self.temp_file.name, 'w') as f:
+            json.dump(['sub1'], f)
+        with open(self.temp_file.name + '.log', 'w') as f:
+            f.write('sub2\nsub3\n')
+
+        self.bot.load_seen_submissions()
+        self.assertEqual(set(self.bot.seen_submissions), {'sub1', 'sub2', 'sub3'})
+
+    def test_mark_seen_appends_to_log(self):
+        """Test that newly seen IDs are appended to the log and cleared by a save"""
+        os.unlink(self.temp_file.name)
+        self.bot.load_seen_submissions()
+
+        self.bot.mark_seen('sub1')
+        self.bot.mark_seen('sub2')
+
+        with open(self.temp_file.name + '.log', 'r') as f:
+            self.assertEqual(f.read().split(), ['sub1', 'sub2'])
+
+        self.bot.save_seen_submissions()
+
+        self.assertEqual(os.path.getsize(self.temp_file.name + '.log'), 0)
+        with open(self.temp_file.name, 'r') as f:
+            self.assertEqual(f.read().split(), ['sub1', 'sub2'])
+
+    @patch('reddit_bot.SEEN_COMPACT_EVERY', 3)
+    def test_mark_seen_compacts_log(self):
+        """Test that the log is folded into the snapshot every SEEN_COMPACT_EVERY new IDs"""
+        os.unlink(self.temp_file.name)
+        self.bot.load_seen_submissions()
+
+        for submission_id in ['sub1', 'sub2', 'sub3', 'sub4']:
+            self.bot.mark_seen(submission_id)
+
+        with open(self.temp_file.name, 'r') as f:
+            self.assertEqual(f.read().split(), ['sub1', 'sub2', 'sub3'])
+        with open(self.temp_file.name + '.log', 'r') as f:
+            self.assertEqual(f.read().split(), ['sub4'])
+
+    def test_seen_submissions_evicts_oldest(self):
+        """Test that the seen set keeps only the most recent IDs in order"""
+        seen = SeenSubmissions(maxlen=3)
+        for submission_id in ['sub1', 'sub2', 'sub3', 'sub4']:
+            seen.add(submission_id)
+
+        self.assertEqual(list(seen), ['sub2', 'sub3', 'sub4'])
+        self.assertNotIn('sub1', seen)
 
     def test_process_already_seen(self):
         """Test processing already seen submission"""
-        mock_sub = Mock()
-        mock_sub.id = 'seen_before'
+        mock_sub = make_submission(id='seen_before')
 
         # Mark as already seen
         self.bot.seen_submissions.add('seen_before')
@@ -150,10 +249,7 @@ class TestMultiClubRedditBot(unittest.TestCase):
 
     def test_process_good_flair(self):
         """Test processing submission with good flair"""
-        mock_sub = Mock()
-        mock_sub.id = 'new_sub'
-        mock_sub.link_flair_text = 'Tier 1'
-        mock_sub.title = 'Chelsea signs new player'
+        mock_sub = make_submission(id='new_sub', link_flair_text='Tier 1', title='Chelsea signs new player')
 
         # Mock the Discord sending
         with patch.object(self.bot, 'send_to_discord', return_value=True):
@@ -164,9 +260,7 @@ class TestMultiClubRedditBot(unittest.TestCase):
 
     def test_process_bad_flair(self):
         """Test processing submission with bad flair"""
-        mock_sub = Mock()
-        mock_sub.id = 'bad_flair_sub'
-        mock_sub.link_flair_text = 'Tier 3'
+        mock_sub = make_submission(id='bad_flair_sub', link_flair_text='Tier 3')
 
         result = self.bot.process_submission(mock_sub, 'chelseafc')
 
@@ -175,12 +269,8 @@ class TestMultiClubRedditBot(unittest.TestCase):
 
     def test_process_soccer_high_score(self):
         """Test processing r/soccer with high score"""
-        mock_sub = Mock()
-        mock_sub.id = 'soccer_sub'
-        mock_sub.title = 'BREAKING: Chelsea transfer news'
-        mock_sub.score = 150
-        mock_sub.link_flair_text = None
-        mock_sub.selftext = ''
+        mock_sub = make_submission(id='soccer_sub', title='BREAKING: Chelsea transfer news', score=150,
+                                   link_flair_text=None)
 
         with patch.object(self.bot, 'send_to_discord', return_value=True):
             result = self.bot.process_submission(mock_sub, 'soccer')
@@ -188,32 +278,22 @@ class TestMultiClubRedditBot(unittest.TestCase):
 
     def test_process_soccer_low_score(self):
         """Test processing r/soccer with low score"""
-        mock_sub = Mock()
-        mock_sub.id = 'low_score_sub'
-        mock_sub.title = 'Chelsea transfer rumor'
-        mock_sub.score = 50
-        mock_sub.selftext = ''
+        mock_sub = make_submission(id='low_score_sub', title='Chelsea transfer rumor', score=50,
+                                   link_flair_text=None)
 
         result = self.bot.process_submission(mock_sub, 'soccer')
 
         self.assertFalse(result)
         self.assertIn('low_score_sub', self.bot.seen_submissions)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_discord_send_success(self, mock_post):
         """Test successful Discord sending"""
         mock_response = Mock()
         mock_response.status_code = 204
         mock_post.return_value = mock_response
 
-        mock_sub = Mock()
-        mock_sub.title = 'Test news'
-        mock_sub.url = 'https://test.com'
-        mock_sub.permalink = '/r/test/123'
-        mock_sub.author = Mock()
-        mock_sub.author.__str__ = Mock(return_value='testuser')
-        mock_sub.created_utc = 1640995200
-        mock_sub.link_flair_text = 'Tier 1'
+        mock_sub = make_submission()
 
         result = self.bot.send_to_discord(mock_sub, 'chelseafc')
 
@@ -221,7 +301,7 @@ class TestMultiClubRedditBot(unittest.TestCase):
         # Should be called twice (2 webhooks)
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_discord_send_partial_failure(self, mock_post):
         """Test partial Discord sending failure"""
         # First succeeds, second fails
@@ -230,14 +310,7 @@ class TestMultiClubRedditBot(unittest.TestCase):
         responses[1].status_code = 400
         mock_post.side_effect = responses
 
-        mock_sub = Mock()
-        mock_sub.title = 'Test news'
-        mock_sub.url = 'https://test.com'
-        mock_sub.permalink = '/r/test/123'
-        mock_sub.author = Mock()
-        mock_sub.author.__str__ = Mock(return_value='testuser')
-        mock_sub.created_utc = 1640995200
-        mock_sub.link_flair_text = 'Tier 1'
+        mock_sub = make_submission()
 
         result = self.bot.send_to_discord(mock_sub, 'chelseafc')
 
@@ -245,21 +318,14 @@ class TestMultiClubRedditBot(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(mock_post.call_count, 2)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_discord_send_all_fail(self, mock_post):
         """Test all Discord webhooks failing"""
         mock_response = Mock()
         mock_response.status_code = 400
         mock_post.return_value = mock_response
 
-        mock_sub = Mock()
-        mock_sub.title = 'Test news'
-        mock_sub.url = 'https://test.com'
-        mock_sub.permalink = '/r/test/123'
-        mock_sub.author = Mock()
-        mock_sub.author.__str__ = Mock(return_value='testuser')
-        mock_sub.created_utc = 1640995200
-        mock_sub.link_flair_text = 'Tier 1'
+        mock_sub = make_submission()
 
         result = self.bot.send_to_discord(mock_sub, 'chelseafc')
 
@@ -267,6 +333,157 @@ class TestMultiClubRedditBot(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(mock_post.call_count, 2)
 
+    @patch('requests.Session.post')
+    def test_sweep_batches_embeds(self, mock_post):
+        """Test that queued sweep embeds are posted in batches of 10 per webhook"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_post.return_value = mock_response
+
+        pending = []
+        for i in range(12):
+            mock_sub = make_submission(id=f'sweep_{i}', title=f'Chelsea news {i}', permalink=f'/r/test/{i}')
+
+            self.assertTrue(self.bot.process_submission(mock_sub, 'chelseafc', pending))
+
+        # Nothing is posted until the batch is flushed
+        self.assertEqual(mock_post.call_count, 0)
+        self.assertEqual(len(pending), 12)
+
+        self.assertEqual(self.bot.flush_embeds(pending), 2)
+
+        # 2 batches (10 + 2) x 2 webhooks
+        self.assertEqual(mock_post.call_count, 4)
+        self.assertEqual(pending, [])
+        batch_sizes = sorted(len(json.loads(call.kwargs['data'])['embeds']) for call in mock_post.call_args_list)
+        self.assertEqual(batch_sizes, [2, 2, 10, 10])
+
+    @patch('requests.Session.post')
+    def test_sweep_batches_respect_text_limit(self, mock_post):
+        """Test that sweep batches are closed before exceeding Discord's 6000 character embed limit"""
+        mock_response = Mock()
+        mock_response.status_code = 204
+        mock_post.return_value = mock_response
+
+        pending = []
+        for i in range(10):
+            mock_sub = make_submission(
+                id=f'long_{i}',
+                title='Chelsea transfer news ' + 'x' * 250,
+                url='https://www.example.com/football/transfers/' + 'a' * 200,
+                permalink=f'/r/chelseafc/comments/{i}/' + 'b' * 150
+            )
+            self.bot.process_submission(mock_sub, 'chelseafc', pending)
+
+        self.assertGreater(sum(reddit_bot.embed_text_length(embed) for embed in pending),
+                           reddit_bot.DISCORD_MAX_EMBED_CHARS)
+
+        self.bot.flush_embeds(pending)
+
+        # Every posted message fits the limit and no embed is dropped
+        bodies = [json.loads(call.kwargs['data']) for call in mock_post.call_args_list]
+        for body in bodies:
+            self.assertLessEqual(len(body['embeds']), reddit_bot.DISCORD_MAX_EMBEDS)
+            self.assertLessEqual(sum(reddit_bot.embed_text_length(embed) for embed in body['embeds']),
+                                 reddit_bot.DISCORD_MAX_EMBED_CHARS)
+        self.assertEqual(sum(len(body['embeds']) for body in bodies), 10 * 2)
+        self.assertGreater(len(bodies), 2)
+
+    @patch('requests.Session.post')
+    def test_discord_send_accepts_any_2xx(self, mock_post):
+        """Test that any 2xx webhook response counts as delivered"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        self.assertTrue(self.bot.post_to_webhook('https://discord.com/api/webhooks/123/abc', b'{}'))
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('reddit_bot.time.sleep')
+    @patch('requests.Session.post')
+    def test_discord_send_rate_limited_retry(self, mock_post, mock_sleep):
+        """Test that a 429 response is retried after the Retry-After delay"""
+        rate_limited = Mock()
+        rate_limited.status_code = 429
+        rate_limited.headers = {'Retry-After': '2'}
+        success = Mock()
+        success.status_code = 204
+        mock_post.side_effect = [rate_limited, success]
+
+        self.assertTrue(self.bot.post_to_webhook('https://discord.com/api/webhooks/123/abc', b'{}'))
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args[0][0], 2)
+
+    @patch('reddit_bot.time.sleep')
+    @patch('requests.Session.post')
+    def test_discord_send_long_rate_limit_gives_up(self, mock_post, mock_sleep):
+        """Test that a Retry-After beyond WEBHOOK_MAX_RETRY_AFTER is not waited for"""
+        rate_limited = Mock()
+        rate_limited.status_code = 429
+        rate_limited.headers = {'Retry-After': '600'}
+        mock_post.return_value = rate_limited
+
+        self.assertFalse(self.bot.post_to_webhook('https://discord.com/api/webhooks/123/abc', b'{}'))
+        self.assertEqual(mock_post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def use_webhook_stub(self, responses):
+        """Point the bot at a local webhook through the real session and retry adapter"""
+        server, url, received = start_webhook_stub(responses)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        session = reddit_bot.build_webhook_session()
+        session.mount('http://', session.get_adapter('https://discord.com'))
+        self.addCleanup(session.close)
+        self.bot.http = session
+        return url, received
+
+    @patch('reddit_bot.time.sleep')
+    def test_rate_limit_only_retried_by_post_to_webhook(self, mock_sleep):
+        """Test that urllib3 leaves 429s alone, so each attempt is exactly one POST"""
+        url, received = self.use_webhook_stub([(429, {'Retry-After': '0'})])
+
+        self.assertFalse(self.bot.post_to_webhook(url, b'{}'))
+        self.assertEqual(len(received), reddit_bot.WEBHOOK_MAX_ATTEMPTS)
+
+    @patch('reddit_bot.time.sleep')
+    def test_fractional_retry_after_reaches_post_to_webhook(self, mock_sleep):
+        """Test that a fractional Retry-After is handled by the manual backoff, not rejected by urllib3"""
+        url, received = self.use_webhook_stub([(429, {'Retry-After': '0.5'}), (204, {})])
+
+        self.assertTrue(self.bot.post_to_webhook(url, b'{}'))
+        self.assertEqual(len(received), 2)
+        self.assertGreaterEqual(mock_sleep.call_args[0][0], 0.5)
+
+    def test_fetch_recent_posts_uses_given_client(self):
+        """Test that sweep workers fetch through their own Reddit client, not the shared one"""
+        self.bot.reddit = Mock()
+        worker_reddit = Mock()
+        worker_reddit.subreddit.return_value.new.return_value = iter(['post'])
+
+        self.assertEqual(self.bot.fetch_recent_posts('gunners', 5, reddit=worker_reddit), ['post'])
+        worker_reddit.subreddit.assert_called_once_with('gunners')
+        self.bot.reddit.subreddit.assert_not_called()
+
+    @patch('reddit_bot.time.sleep')
+    def test_stream_reconnect_backoff(self, mock_sleep):
+        """Test that repeated stream errors back off exponentially"""
+        self.bot.reddit = Mock()
+        self.bot.reddit.subreddit.return_value.stream.submissions.side_effect = [
+            Exception('down'), Exception('still down'), Exception('down again'), KeyboardInterrupt
+        ]
+
+        with patch.object(self.bot, 'connect_to_reddit'):
+            with self.assertRaises(KeyboardInterrupt):
+                self.bot.monitor_all_subreddits()
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        for delay, base in zip(delays, [1, 2, 4]):
+            self.assertGreaterEqual(delay, base)
+            self.assertLess(delay, base + 1)
+
     def test_club_configurations(self):
         """Test that all clubs are properly configured"""
         expected_clubs = [
@@ -306,7 +523,7 @@ class TestMultiClubRedditBot(unittest.TestCase):
 
     def test_target_flairs(self):
         """Test that target flairs are correctly set"""
-        expected_flairs = ['Tier 1', 'Tier 2', 'Official Source']
+        expected_flairs = frozenset(['Tier 1', 'Tier 2', 'Official Source'])
         self.assertEqual(self.bot.target_flairs, expected_flairs)
 
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Telegram bot's seen message storage
+"""
+
+import unittest
+from unittest.mock import patch
+import json
+import os
+import stat
+import tempfile
+
+from bot.shared import storage
+from bot.shared.storage import MessageStorage
+
+
+class TestMessageStorage(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'seen_messages.json')
+        self.storage = MessageStorage(self.file_path)
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        self.storage.close()
+        self.temp_dir.cleanup()
+
+    def read_lines(self, path):
+        """Read the IDs stored one per line in a file"""
+        with open(path, 'r') as f:
+            return f.read().split()
+
+    def test_load_replays_log(self):
+        """Test that IDs appended to the log are loaded on top of the snapshot"""
+        with open(self.file_path, 'w') as f:
+            f.write('msg1\nmsg2\n')
+        with open(self.storage.log_path, 'w') as f:
+            f.write('msg3\nmsg4\n')
+
+        self.storage.load()
+
+        self.assertEqual(list(self.storage.seen_messages), ['msg1', 'msg2', 'msg3', 'msg4'])
+
+    def test_load_legacy_json(self):
+        """Test loading a snapshot written as a JSON array by older versions"""
+        with open(self.file_path, 'w') as f:
+            json.dump(['msg1', 'msg2', 'msg3'], f, indent=2)
+
+        self.storage.load()
+
+        self.assertEqual(list(self.storage.seen_messages), ['msg1', 'msg2', 'msg3'])
+
+    def test_evicts_oldest(self):
+        """Test that only the MAX_SEEN most recent IDs are kept, oldest evicted first"""
+        with patch.object(storage, 'MAX_SEEN', 3):
+            for message_id in ['msg1', 'msg2', 'msg3', 'msg4']:
+                self.storage.mark_seen(message_id)
+
+        self.assertEqual(list(self.storage.seen_messages), ['msg2', 'msg3', 'msg4'])
+        self.assertFalse(self.storage.is_seen('msg1'))
+
+    def test_compacts_at_threshold(self):
+        """Test that the log is folded into the snapshot every COMPACT_EVERY new IDs"""
+        self.storage.load()
+
+        with patch.object(storage, 'COMPACT_EVERY', 3):
+            for message_id in ['msg1', 'msg2', 'msg3', 'msg4']:
+                self.storage.mark_seen(message_id)
+
+        self.assertEqual(self.read_lines(self.file_path), ['msg1', 'msg2', 'msg3'])
+        self.assertEqual(self.read_lines(self.storage.log_path), ['msg4'])
+
+    def test_save_truncates_log(self):
+        """Test that save writes the snapshot and empties the log"""
+        self.storage.load()
+        self.storage.mark_seen('msg1')
+        self.storage.mark_seen('msg2')
+        self.assertEqual(self.read_lines(self.storage.log_path), ['msg1', 'msg2'])
+
+        self.storage.save()
+
+        self.assertEqual(os.path.getsize(self.storage.log_path), 0)
+        self.assertEqual(self.read_lines(self.file_path), ['msg1', 'msg2'])
+        self.assertEqual(stat.S_IMODE(os.stat(self.file_path).st_mode), 0o644)
+
+        # A restart sees the same IDs
+        self.storage.close()
+        reloaded = MessageStorage(self.file_path)
+        reloaded.load()
+        self.assertEqual(list(reloaded.seen_messages), ['msg1', 'msg2'])
+        reloaded.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)